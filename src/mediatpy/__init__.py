@@ -1,8 +1,23 @@
+import asyncio
+import heapq
 import logging
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from functools import cache
-from typing import Awaitable, Callable, Generic, Type, TypeAlias, TypeVar, get_args
+from collections import defaultdict
+from functools import partial
+from operator import itemgetter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Generic,
+    Literal,
+    Sequence,
+    Type,
+    TypeAlias,
+    TypeVar,
+    get_args,
+)
 
 # https://docs.python.org/3/howto/logging.html#library-config
 _logger = logging.getLogger(__name__)
@@ -11,6 +26,14 @@ _logger.addHandler(logging.NullHandler())
 TResponse = TypeVar("TResponse")
 
 
+def _set_message_type(handler: type) -> None:
+    # Extracted once per class, when it is defined, so registrations only read an attribute
+    try:
+        handler.__mediatpy_message_type__ = get_args(handler.__orig_bases__[0])[0]  # type: ignore
+    except (AttributeError, IndexError):
+        pass
+
+
 class Request(Generic[TResponse]):
     """
     Base class for any request
@@ -22,30 +45,127 @@ class Request(Generic[TResponse]):
 TRequest = TypeVar("TRequest", bound=Request)
 
 
-class RequestHandler(ABC, Generic[TRequest, TResponse]):
+class RequestHandler(Generic[TRequest, TResponse]):
     """
     Base class for any request handler
     """
 
-    @abstractmethod
     async def handle(self, request: TRequest) -> TResponse:
-        pass
+        raise NotImplementedError
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _set_message_type(cls)
+
+
+class BatchingRequestHandler(RequestHandler[TRequest, TResponse]):
+    """
+    Base class for a request handler that handles concurrently sent requests in batches
 
+    Requests are queued until ``batch_size`` of them are waiting or ``max_wait_ms`` have elapsed since the first one,
+    then :meth:`handle_batch` is called once for all of them and every sender gets its own response.
+    It is always registered as a singleton, so subclasses overriding ``__init__`` must call ``super().__init__()``.
 
-class PipelineBehavior(ABC, Generic[TRequest, TResponse]):
+    .. code-block:: python
+
+        class MyBatchingRequestHandler(BatchingRequestHandler[MyRequest, MyResponse]):
+            batch_size = 50
+
+            async def handle_batch(self, requests: list[MyRequest]) -> list[MyResponse]:
+                return [MyResponse() for _ in requests]
+    """
+
+    batch_size: ClassVar[int] = 100
+    max_wait_ms: ClassVar[float] = 5
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[TRequest, asyncio.Future[TResponse]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    async def handle_batch(self, requests: list[TRequest]) -> list[TResponse]:
+        """
+        Method to handle a batch of requests and to return their responses in the same order
+
+        :param requests: Requests to be handled
+        """
+        raise NotImplementedError
+
+    async def handle(self, request: TRequest) -> TResponse:
+        future: asyncio.Future[TResponse] = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.batch_size:
+            self._start_batch_task(self._handle_batch(self._take_pending()))
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._start_batch_task(self._flush_after_max_wait())
+            self._flush_task.add_done_callback(self._flush_task_done)
+        return await future
+
+    def _start_batch_task(self, coroutine: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        # Keep a reference until it finishes, the event loop only keeps weak references to tasks
+        batch_task = asyncio.create_task(coroutine)
+        self._batch_tasks.add(batch_task)
+        batch_task.add_done_callback(self._batch_tasks.discard)
+        return batch_task
+
+    def _flush_task_done(self, flush_task: asyncio.Task[None]) -> None:
+        if self._flush_task is flush_task:
+            self._flush_task = None
+
+    def _take_pending(self) -> list[tuple[TRequest, asyncio.Future[TResponse]]]:
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+        self._flush_task = None
+        pending, self._pending = self._pending, []
+        return pending
+
+    async def _flush_after_max_wait(self) -> None:
+        try:
+            await asyncio.sleep(self.max_wait_ms / 1000)
+        except asyncio.CancelledError:
+            # Cancelled from outside (e.g. when its event loop shuts down), so nobody else would flush the pending ones
+            if self._flush_task is asyncio.current_task():
+                for _, future in self._take_pending():
+                    future.cancel()
+            raise
+        await self._handle_batch(self._take_pending())
+
+    async def _handle_batch(self, batch: list[tuple[TRequest, asyncio.Future[TResponse]]]) -> None:
+        try:
+            responses = await self.handle_batch([request for request, _ in batch])
+            if len(responses) != len(batch):
+                raise ValueError(f"{type(self)} returned {len(responses)} responses for {len(batch)} requests.")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+class PipelineBehavior(Generic[TRequest, TResponse]):
     """
     Base class for any pipeline behavior
     """
 
-    @abstractmethod
     async def handle(self, request: TRequest, next_behavior: Callable[..., Awaitable[TResponse]]) -> TResponse:
         """
-        Abstract method to handle a request and to return a response
+        Method to handle a request and to return a response
 
         :param request: Request to be handled
         :param next_behavior: Next pipeline behavior or request handler to execute
         """
-        pass
+        raise NotImplementedError
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _set_message_type(cls)
 
 
 class Notification:
@@ -59,23 +179,23 @@ class Notification:
 TNotification = TypeVar("TNotification", bound=Notification)
 
 
-class NotificationHandler(ABC, Generic[TNotification]):
+class NotificationHandler(Generic[TNotification]):
     """
     Base class for any notification handler
     """
 
-    @abstractmethod
     async def handle(self, notification: TNotification) -> None:
-        pass
+        raise NotImplementedError
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _set_message_type(cls)
 
-Handler: TypeAlias = Type[RequestHandler | PipelineBehavior | NotificationHandler]
 
-
-@dataclass
-class _PipelineBehaviorRegistration:
-    pipeline_behavior: Type[PipelineBehavior]
-    position: int
+Handler: TypeAlias = Type[RequestHandler | PipelineBehavior | NotificationHandler]
+_SendStep: TypeAlias = Callable[[Request, RequestHandler], Awaitable[Any]]
+_SendDispatch: TypeAlias = Callable[[Request], Awaitable[Any]]
+PublishStrategy: TypeAlias = Literal["sequential", "parallel"]
 
 
 class NoRequestHandlerFoundError(Exception):
@@ -85,7 +205,10 @@ class NoRequestHandlerFoundError(Exception):
 
     def __init__(self, request: Request) -> None:
         self.request = request
-        super().__init__(f"There is no registered handler for request {type(request)}.")
+        super().__init__(request)
+
+    def __str__(self) -> str:
+        return f"There is no registered handler for request {type(self.request)}."
 
 
 class NotAnyNotificationHandlerFoundError(Exception):
@@ -95,7 +218,10 @@ class NotAnyNotificationHandlerFoundError(Exception):
 
     def __init__(self, notification: Notification) -> None:
         self.notification = notification
-        super().__init__(f"There are not any registered handler for notification {notification}.")
+        super().__init__(notification)
+
+    def __str__(self) -> str:
+        return f"There are not any registered handler for notification {self.notification}."
 
 
 class Mediator:
@@ -113,6 +239,8 @@ class Mediator:
     :param notification_handler_factory: Custom :class:`NotificationHandler` factory
     :param raise_error_if_not_any_registered_notification_handler: Raise an error if no :class:`NotificationHandler`
         is found when a :class:`Notification` is published
+    :param publish_strategy: ``"sequential"`` awaits every :class:`NotificationHandler` one after another,
+        ``"parallel"`` runs all of them concurrently and, once all of them have finished, raises the first error
     """
 
     def __init__(
@@ -122,6 +250,7 @@ class Mediator:
         notification_handler_factory: Callable[[Type[NotificationHandler]], Awaitable[NotificationHandler]]
         | None = None,
         raise_error_if_not_any_registered_notification_handler: bool = False,
+        publish_strategy: PublishStrategy = "sequential",
     ) -> None:
         self.request_handler_factory = (
             self._default_request_handler_factory if request_handler_factory is None else request_handler_factory
@@ -130,17 +259,29 @@ class Mediator:
         self.pipeline_behavior_factory = (
             self._default_pipeline_behavior_factory if pipeline_behavior_factory is None else pipeline_behavior_factory
         )
-        self._pipeline_behaviors: dict[Type[Request], list[_PipelineBehaviorRegistration]] = {}
+        # Each registration keeps its global position, to merge behaviors registered for different bases in order
+        self._pipeline_behaviors: defaultdict[Type[Request], list[tuple[int, Type[PipelineBehavior]]]] = defaultdict(
+            list
+        )
         self._pipeline_behavior_position = 0
         self.notification_handler_factory = (
             self._default_notification_handler_factory
             if notification_handler_factory is None
             else notification_handler_factory
         )
-        self._notification_handlers: dict[Type[Notification], list[Type[NotificationHandler]]] = {}
+        self._notification_handlers: defaultdict[Type[Notification], list[Type[NotificationHandler]]] = defaultdict(
+            list
+        )
+        self._pipeline_behaviors_cache: dict[Type[Request], tuple[Type[PipelineBehavior], ...]] = {}
+        self._notification_handlers_cache: dict[Type[Notification], tuple[Type[NotificationHandler], ...]] = {}
+        self._send_dispatch: dict[Type[Request], _SendDispatch] = {}
+        self._singleton_handler_types: set[Handler] = set()
+        self._singleton_handlers: dict[Handler, Any] = {}
+        self._singleton_creations: dict[Handler, asyncio.Future[Any]] = {}
         self._raise_error_if_not_any_registered_notification_handler = (
             raise_error_if_not_any_registered_notification_handler
         )
+        self._publish_strategy = publish_strategy
 
     @staticmethod
     async def _default_request_handler_factory(request_handler: Type[RequestHandler]) -> RequestHandler:
@@ -158,11 +299,20 @@ class Mediator:
 
     @staticmethod
     def _get_request_type(handler: Handler) -> Type[Request]:
-        return get_args(handler.__orig_bases__[0])[0]  # type: ignore
+        return handler.__mediatpy_message_type__  # type: ignore
 
     @staticmethod
     def _get_notification_type(notification_handler: Type[NotificationHandler]) -> Type[Notification]:
-        return get_args(notification_handler.__orig_bases__[0])[0]  # type: ignore
+        return notification_handler.__mediatpy_message_type__  # type: ignore
+
+    @staticmethod
+    def _bind_pipeline_behavior(pipeline_behavior: PipelineBehavior, next_dispatch: _SendDispatch) -> _SendDispatch:
+        handle = pipeline_behavior.handle
+
+        async def _step(request: Request) -> Any:
+            return await handle(request, partial(next_dispatch, request))
+
+        return _step
 
     def request_handler(self, request_handler: Type[RequestHandler]) -> None:
         """
@@ -189,35 +339,46 @@ class Mediator:
         """
         self.register_notification_handler(notification_handler)
 
-    def register_request_handler(self, request_handler: Type[RequestHandler]) -> None:
+    def register_request_handler(self, request_handler: Type[RequestHandler], *, singleton: bool = False) -> None:
         """
         Manual registration of a :class:`RequestHandler`
 
         .. code-block:: python
 
             my_mediator.register_request_handler(MyRequestHandler)
+
+        :param singleton: Create the handler only once, on its first use, and reuse that instance afterwards
         """
         request = self._get_request_type(request_handler)
         self._request_handlers[request] = request_handler
+        self._set_singleton(request_handler, singleton or issubclass(request_handler, BatchingRequestHandler))
+        self._send_dispatch.clear()
 
-    def register_notification_handler(self, notification_handler: Type[NotificationHandler]) -> None:
+    def register_notification_handler(
+        self, notification_handler: Type[NotificationHandler], *, singleton: bool = False
+    ) -> None:
         """
         Manual registration of a :class:`NotificationHandler`
+
+        :param singleton: Create the handler only once, on its first use, and reuse that instance afterwards
         """
         notification = self._get_notification_type(notification_handler)
-        notification_handlers = self._notification_handlers.get(notification, [])
-        notification_handlers.append(notification_handler)
-        self._notification_handlers[notification] = notification_handlers
+        self._set_singleton(notification_handler, singleton)
+        self._notification_handlers[notification].append(notification_handler)
+        self._notification_handlers_cache.clear()
 
-    def register_pipeline_behavior(self, pipeline_behavior: Type[PipelineBehavior]) -> None:
+    def register_pipeline_behavior(self, pipeline_behavior: Type[PipelineBehavior], *, singleton: bool = False) -> None:
         """
         Manual registration of a :class:`PipelineBehavior`
+
+        :param singleton: Create the behavior only once, on its first use, and reuse that instance afterwards
         """
         request = self._get_request_type(pipeline_behavior)
-        pipeline_behaviors = self._pipeline_behaviors.get(request, [])
-        pipeline_behaviors.append(_PipelineBehaviorRegistration(pipeline_behavior, self._pipeline_behavior_position))
-        self._pipeline_behaviors[request] = pipeline_behaviors
+        self._set_singleton(pipeline_behavior, singleton)
+        self._pipeline_behaviors[request].append((self._pipeline_behavior_position, pipeline_behavior))
         self._pipeline_behavior_position += 1
+        self._pipeline_behaviors_cache.clear()
+        self._send_dispatch.clear()
 
     async def send(self, request: Request[TResponse]) -> TResponse:
         """
@@ -228,16 +389,33 @@ class Mediator:
             my_request = MyRequest()
             await my_mediator.send(my_request)
         """
-        _logger.debug(f"Sending request {request}")
-        if not type(request) in self._request_handlers:
-            raise NoRequestHandlerFoundError(request)
-        request_handler = await self._create_request_handler(self._request_handlers[type(request)])
-        pipeline_behaviors = self._resolve_pipeline_behaviors(request)
-        if not any(pipeline_behaviors):
-            return await request_handler.handle(request)
-        first_pipeline_behavior = await self._create_pipeline_behavior(pipeline_behaviors[0].pipeline_behavior)
-        next_pipeline_behavior = self._get_next_pipeline_behavior(request, request_handler, pipeline_behaviors, 0)
-        return await first_pipeline_behavior.handle(request, next_pipeline_behavior)
+        _logger.debug("Sending request %s", request)
+        dispatch = self._send_dispatch.get(type(request))
+        if dispatch is None:
+            dispatch = self._compile_send(request)
+        return await dispatch(request)
+
+    async def send_many(self, requests: Sequence[Request[TResponse]]) -> list[TResponse]:
+        """
+        Send several :class:`Request` of the same type concurrently, resolving their pipeline only once
+
+        .. code-block:: python
+
+            my_requests = [MyRequest(), MyRequest()]
+            await my_mediator.send_many(my_requests)
+
+        :return: Responses in the same order as the requests
+        """
+        if not requests:
+            return []
+        request_type = type(requests[0])
+        if any(type(request) is not request_type for request in requests):
+            raise ValueError("All requests sent at once must be of the same type.")
+        _logger.debug("Sending %s requests %s", len(requests), request_type)
+        dispatch = self._send_dispatch.get(request_type)
+        if dispatch is None:
+            dispatch = self._compile_send(requests[0])
+        return await asyncio.gather(*map(dispatch, requests))
 
     async def publish(self, notification: Notification) -> None:
         """
@@ -248,54 +426,194 @@ class Mediator:
             my_notification = MyNotification()
             await my_mediator.publish(my_notification)
         """
-        _logger.debug(f"Publishing notification {notification}")
-        notification_handlers = self._resolve_notification_handlers(notification)
-        if not any(notification_handlers) and self._raise_error_if_not_any_registered_notification_handler:
-            raise NotAnyNotificationHandlerFoundError(notification)
-
+        _logger.debug("Publishing notification %s", notification)
+        notification_handlers = self._resolve_notification_handlers(type(notification))
+        if not notification_handlers:
+            if self._raise_error_if_not_any_registered_notification_handler:
+                raise NotAnyNotificationHandlerFoundError(notification)
+            return
+
+        if self._publish_strategy == "parallel":
+            # Wait for every handler before raising, so none of them is left running unawaited
+            results = await asyncio.gather(
+                *(
+                    self._handle_notification(notification_handler, notification)
+                    for notification_handler in notification_handlers
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return
+
+        notification_handler_factory = self.notification_handler_factory
+        is_default_factory = notification_handler_factory is self._default_notification_handler_factory
+        singleton_handler_types = self._singleton_handler_types
         for notification_handler in notification_handlers:
-            await (await self._create_notification_handler(notification_handler)).handle(notification)
-
-    async def _create_request_handler(self, request_handler: Type[RequestHandler]) -> RequestHandler:
-        return await self.request_handler_factory(request_handler)
-
-    async def _create_pipeline_behavior(self, pipeline_behavior: Type[PipelineBehavior]) -> PipelineBehavior:
-        return await self.pipeline_behavior_factory(pipeline_behavior)
+            instance = (
+                notification_handler()
+                if is_default_factory and notification_handler not in singleton_handler_types
+                else await self._create_handler(notification_handler, notification_handler_factory)
+            )
+            await instance.handle(notification)
+
+    def _set_singleton(self, handler: Handler, singleton: bool) -> None:
+        self._singleton_handlers.pop(handler, None)
+        self._singleton_creations.pop(handler, None)
+        if singleton:
+            self._singleton_handler_types.add(handler)
+        else:
+            self._singleton_handler_types.discard(handler)
+
+    async def _handle_notification(
+        self, notification_handler: Type[NotificationHandler], notification: Notification
+    ) -> None:
+        notification_handler_factory = self.notification_handler_factory
+        instance = (
+            notification_handler()
+            if notification_handler_factory is self._default_notification_handler_factory
+            and notification_handler not in self._singleton_handler_types
+            else await self._create_handler(notification_handler, notification_handler_factory)
+        )
+        await instance.handle(notification)
+
+    async def _create_handler(self, handler: Handler, factory: Callable[[Any], Awaitable[Any]]) -> Any:
+        # Only awaited off the common path, a default factory for a non singleton is instantiated inline by callers
+        if handler in self._singleton_handler_types:
+            return await self._get_singleton(handler, factory)
+        return await factory(handler)
+
+    def _resolve_pipeline_behaviors(self, request_type: Type[Request]) -> tuple[Type[PipelineBehavior], ...]:
+        cache = self._pipeline_behaviors_cache
+        hit = cache.get(request_type)
+        if hit is not None:
+            return hit
+        matching = [
+            pipeline_behaviors
+            for pipeline_behaviors in map(self._pipeline_behaviors.get, request_type.__mro__)
+            if pipeline_behaviors is not None
+        ]
+        # Every list is already in registration order, so merging them by position keeps the global order
+        registrations = matching[0] if len(matching) == 1 else heapq.merge(*matching, key=itemgetter(0))
+        resolved = tuple(pipeline_behavior for _, pipeline_behavior in registrations)
+        cache[request_type] = resolved
+        return resolved
+
+    def _resolve_notification_handlers(
+        self, notification_type: Type[Notification]
+    ) -> tuple[Type[NotificationHandler], ...]:
+        cache = self._notification_handlers_cache
+        hit = cache.get(notification_type)
+        if hit is not None:
+            return hit
+        resolved = tuple(
+            notification_handler
+            for notification_handlers in map(self._notification_handlers.get, notification_type.__mro__)
+            if notification_handlers is not None
+            for notification_handler in notification_handlers
+        )
+        cache[notification_type] = resolved
+        return resolved
 
-    async def _create_notification_handler(
-        self, notification_handler: Type[NotificationHandler]
-    ) -> NotificationHandler:
-        return await self.notification_handler_factory(notification_handler)
+    def _compile_send(self, request: Request) -> _SendDispatch:
+        request_type = type(request)
+        request_handler_type = self._request_handlers.get(request_type)
+        if request_handler_type is None:
+            raise NoRequestHandlerFoundError(request)
+        pipeline_behaviors = self._resolve_pipeline_behaviors(request_type)
+        singleton_handler_types = self._singleton_handler_types
+        is_singleton = request_handler_type in singleton_handler_types
+        default_request_handler_factory = self._default_request_handler_factory
+
+        if is_singleton and singleton_handler_types.issuperset(pipeline_behaviors):
+            _dispatch = self._compile_singleton_send(request_type, request_handler_type, pipeline_behaviors)
+        elif not pipeline_behaviors:
+
+            async def _dispatch(request: Request) -> Any:
+                request_handler_factory = self.request_handler_factory
+                request_handler = (
+                    request_handler_type()
+                    if not is_singleton and request_handler_factory is default_request_handler_factory
+                    else await self._create_handler(request_handler_type, request_handler_factory)
+                )
+                return await request_handler.handle(request)
 
-    @cache
-    def _resolve_pipeline_behaviors(self, request: Request) -> list[_PipelineBehaviorRegistration]:
-        matching = [value for key, value in self._pipeline_behaviors.items() if issubclass(type(request), key)]
-        flattened = [pipeline_behavior for sublist in matching for pipeline_behavior in sublist]
-        return sorted(flattened, key=lambda pipeline_behavior: pipeline_behavior.position)
+        else:
+            step = self._chain_pipeline_behavior(pipeline_behaviors[-1], None)
+            for pipeline_behavior in reversed(pipeline_behaviors[:-1]):
+                step = self._chain_pipeline_behavior(pipeline_behavior, step)
+            first_step = step
+
+            async def _dispatch(request: Request) -> Any:
+                request_handler_factory = self.request_handler_factory
+                request_handler = (
+                    request_handler_type()
+                    if not is_singleton and request_handler_factory is default_request_handler_factory
+                    else await self._create_handler(request_handler_type, request_handler_factory)
+                )
+                return await first_step(request, request_handler)
 
-    @cache
-    def _resolve_notification_handlers(self, request: Request) -> list[Type[NotificationHandler]]:
-        matching = [value for key, value in self._notification_handlers.items() if issubclass(type(request), key)]
-        return [notification_handler for sublist in matching for notification_handler in sublist]
+        self._send_dispatch[request_type] = _dispatch
+        return _dispatch
 
-    def _get_next_pipeline_behavior(
+    def _compile_singleton_send(
         self,
-        request: Request,
-        request_handler: RequestHandler,
-        pipeline_behaviors: list[_PipelineBehaviorRegistration],
-        index: int,
-    ) -> Callable[..., Awaitable[TResponse]]:
-        async def _() -> TResponse:
-            next_index = index + 1
-            is_last_pipeline_behavior = next_index == len(pipeline_behaviors)
-            if is_last_pipeline_behavior:
-                return await request_handler.handle(request)
-            else:
-                next_pipeline_behavior = await self._create_pipeline_behavior(
-                    pipeline_behaviors[next_index].pipeline_behavior
-                )
-                return await next_pipeline_behavior.handle(
-                    request, self._get_next_pipeline_behavior(request, request_handler, pipeline_behaviors, next_index)
-                )
-
-        return _
+        request_type: Type[Request],
+        request_handler_type: Type[RequestHandler],
+        pipeline_behaviors: tuple[Type[PipelineBehavior], ...],
+    ) -> _SendDispatch:
+        async def _dispatch(request: Request) -> Any:
+            # Once every instance exists, the chain is bound to them and replaces this dispatch
+            request_handler = await self._get_singleton(request_handler_type, self.request_handler_factory)
+            dispatch: _SendDispatch = request_handler.handle
+            for pipeline_behavior in reversed(pipeline_behaviors):
+                behavior = await self._get_singleton(pipeline_behavior, self.pipeline_behavior_factory)
+                dispatch = self._bind_pipeline_behavior(behavior, dispatch)
+            if self._send_dispatch.get(request_type) is _dispatch:
+                self._send_dispatch[request_type] = dispatch
+            return await dispatch(request)
+
+        return _dispatch
+
+    async def _get_singleton(self, handler: Handler, factory: Callable[[Any], Awaitable[Any]]) -> Any:
+        instance = self._singleton_handlers.get(handler)
+        if instance is not None:
+            return instance
+        creation = self._singleton_creations.get(handler)
+        if creation is None:
+            # Concurrent first users await this same creation instead of calling the factory again
+            creation = asyncio.ensure_future(factory(handler))
+            self._singleton_creations[handler] = creation
+            creation.add_done_callback(partial(self._singleton_created, handler))
+        return await asyncio.shield(creation)
+
+    def _singleton_created(self, handler: Handler, creation: asyncio.Future[Any]) -> None:
+        if self._singleton_creations.get(handler) is not creation:
+            return
+        del self._singleton_creations[handler]
+        if not creation.cancelled() and creation.exception() is None:
+            self._singleton_handlers[handler] = creation.result()
+
+    def _chain_pipeline_behavior(
+        self, pipeline_behavior: Type[PipelineBehavior], next_step: _SendStep | None
+    ) -> _SendStep:
+        is_singleton = pipeline_behavior in self._singleton_handler_types
+        default_pipeline_behavior_factory = self._default_pipeline_behavior_factory
+
+        async def _step(request: Request, request_handler: RequestHandler) -> Any:
+            pipeline_behavior_factory = self.pipeline_behavior_factory
+            behavior = (
+                pipeline_behavior()
+                if not is_singleton and pipeline_behavior_factory is default_pipeline_behavior_factory
+                else await self._create_handler(pipeline_behavior, pipeline_behavior_factory)
+            )
+            # The last behavior calls the request handler straight away, with no intermediate step
+            next_behavior = (
+                partial(request_handler.handle, request)
+                if next_step is None
+                else partial(next_step, request, request_handler)
+            )
+            return await behavior.handle(request, next_behavior)
+
+        return _step
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Type
+
+import pytest
+from assertpy import assert_that
+
+from mediatpy import BatchingRequestHandler, Mediator, RequestHandler
+from tests.test_data.create_mediator import create_mediator
+from tests.test_data.my_request import MyRequest
+from tests.test_data.my_response import MyResponse
+
+
+class MyBatchingRequestHandler(BatchingRequestHandler[MyRequest, MyResponse]):
+    batch_size = 3
+    max_wait_ms = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[MyRequest]] = []
+
+    async def handle_batch(self, requests: list[MyRequest]) -> list[MyResponse]:
+        self.batches.append(requests)
+        return [MyResponse(request.q) for request in requests]
+
+
+class FailingBatchingRequestHandler(BatchingRequestHandler[MyRequest, MyResponse]):
+    max_wait_ms = 1
+
+    async def handle_batch(self, requests: list[MyRequest]) -> list[MyResponse]:
+        raise RuntimeError("batch failed")
+
+
+class SlowBatchingRequestHandler(BatchingRequestHandler[MyRequest, MyResponse]):
+    max_wait_ms = 50
+
+    async def handle_batch(self, requests: list[MyRequest]) -> list[MyResponse]:
+        return [MyResponse(request.q) for request in requests]
+
+
+def _create_mediator_with_awaiting_factory(created: list[MyBatchingRequestHandler]) -> Mediator:
+    async def _request_handler_factory(request_handler: Type[RequestHandler]) -> RequestHandler:
+        await asyncio.sleep(0)
+        instance = request_handler()
+        created.append(instance)  # type: ignore[arg-type]
+        return instance
+
+    mediator = create_mediator(request_handler_factory=_request_handler_factory)
+    mediator.register_request_handler(MyBatchingRequestHandler)
+    return mediator
+
+
+async def test_when_requests_are_sent_concurrently_then_are_handled_in_batches() -> None:
+    created: list[MyBatchingRequestHandler] = []
+    mediator = _create_mediator_with_awaiting_factory(created)
+
+    responses = await asyncio.gather(*(mediator.send(MyRequest(str(i))) for i in range(4)))
+
+    assert_that([response.result for response in responses]).is_equal_to(["0", "1", "2", "3"])
+    assert_that(created).is_length(1)
+    assert_that([len(batch) for batch in created[0].batches]).is_equal_to([3, 1])
+
+
+async def test_when_requests_are_sent_at_once_then_are_handled_in_batches() -> None:
+    created: list[MyBatchingRequestHandler] = []
+    mediator = _create_mediator_with_awaiting_factory(created)
+
+    responses = await mediator.send_many([MyRequest(str(i)) for i in range(4)])
+
+    assert_that([response.result for response in responses]).is_equal_to(["0", "1", "2", "3"])
+    assert_that(created).is_length(1)
+    assert_that([len(batch) for batch in created[0].batches]).is_equal_to([3, 1])
+
+
+async def test_when_a_batch_fails_then_every_sender_gets_the_error() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(FailingBatchingRequestHandler)
+
+    results = await asyncio.gather(mediator.send(MyRequest()), mediator.send(MyRequest()), return_exceptions=True)
+
+    assert_that(results).is_length(2)
+    for result in results:
+        assert_that(result).is_instance_of(RuntimeError)
+
+
+async def test_when_a_batch_does_not_return_a_response_per_request_then_an_error_is_thrown() -> None:
+    class WrongBatchingRequestHandler(BatchingRequestHandler[MyRequest, MyResponse]):
+        max_wait_ms = 1
+
+        async def handle_batch(self, requests: list[MyRequest]) -> list[MyResponse]:
+            return []
+
+    mediator = create_mediator()
+    mediator.register_request_handler(WrongBatchingRequestHandler)
+
+    with pytest.raises(ValueError):
+        await mediator.send(MyRequest())
+
+
+def test_when_a_flush_is_cancelled_then_next_requests_are_still_handled() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(SlowBatchingRequestHandler)
+
+    async def _send_with_timeout(timeout: float) -> MyResponse:
+        return await asyncio.wait_for(mediator.send(MyRequest("test")), timeout)
+
+    # Shutting down the first event loop cancels the scheduled flush
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_send_with_timeout(0.001))
+    response = asyncio.run(_send_with_timeout(1))
+
+    assert_that(response.result).is_equal_to("test")
@@ -1,6 +1,6 @@
 from typing import Awaitable, Callable, Type
 
-from mediatpy import Mediator, NotificationHandler, PipelineBehavior, RequestHandler
+from mediatpy import Mediator, NotificationHandler, PipelineBehavior, PublishStrategy, RequestHandler
 
 
 def create_mediator(
@@ -8,10 +8,12 @@ def create_mediator(
     pipeline_behavior_factory: Callable[[Type[PipelineBehavior]], Awaitable[PipelineBehavior]] | None = None,
     notification_handler_factory: Callable[[Type[NotificationHandler]], Awaitable[NotificationHandler]] | None = None,
     raise_error_if_not_any_registered_notification_handler: bool = False,
+    publish_strategy: PublishStrategy = "sequential",
 ) -> Mediator:
     return Mediator(
         request_handler_factory,
         pipeline_behavior_factory,
         notification_handler_factory,
         raise_error_if_not_any_registered_notification_handler,
+        publish_strategy,
     )
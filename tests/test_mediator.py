@@ -1,3 +1,7 @@
+import asyncio
+import gc
+import pickle
+import weakref
 from typing import Awaitable, Callable, Type
 from unittest.mock import AsyncMock
 
@@ -43,11 +47,66 @@ class OtherPipelineBehavior(PipelineBehavior[Request, MyResponse]):
         return response
 
 
+class ShortCircuitPipelineBehavior(PipelineBehavior[MyRequest, MyResponse]):
+    async def handle(self, request: MyRequest, next_behavior: Callable[..., Awaitable[MyResponse]]) -> MyResponse:
+        return MyResponse("short_circuit")
+
+
+class TracedRequest(MyRequest):
+    def __init__(self) -> None:
+        super().__init__()
+        self.trace: list[str] = []
+
+
+class TracedRequestHandler(RequestHandler[TracedRequest, MyResponse]):
+    async def handle(self, request: TracedRequest) -> MyResponse:
+        request.trace.append("handler")
+        return MyResponse("test")
+
+
+class RequestTracingPipelineBehavior(PipelineBehavior[Request, MyResponse]):
+    async def handle(self, request: Request, next_behavior: Callable[..., Awaitable[MyResponse]]) -> MyResponse:
+        if isinstance(request, TracedRequest):
+            request.trace.append("request")
+        return await next_behavior()
+
+
+class MyRequestTracingPipelineBehavior(PipelineBehavior[MyRequest, MyResponse]):
+    async def handle(self, request: MyRequest, next_behavior: Callable[..., Awaitable[MyResponse]]) -> MyResponse:
+        if isinstance(request, TracedRequest):
+            request.trace.append("my_request")
+        return await next_behavior()
+
+
+class TracedRequestTracingPipelineBehavior(PipelineBehavior[TracedRequest, MyResponse]):
+    async def handle(self, request: TracedRequest, next_behavior: Callable[..., Awaitable[MyResponse]]) -> MyResponse:
+        request.trace.append("traced_request")
+        return await next_behavior()
+
+
 class MyNotificationHandler(NotificationHandler[MyNotification]):
     async def handle(self, notification: MyNotification) -> None:
         notification.add_data("test", "test")
 
 
+class RendezvousNotification(Notification):
+    def __init__(self) -> None:
+        self.first_arrived = asyncio.Event()
+        self.second_arrived = asyncio.Event()
+
+
+class FirstRendezvousNotificationHandler(NotificationHandler[RendezvousNotification]):
+    async def handle(self, notification: RendezvousNotification) -> None:
+        notification.first_arrived.set()
+        await notification.second_arrived.wait()
+
+
+class SecondRendezvousNotificationHandler(NotificationHandler[RendezvousNotification]):
+    async def handle(self, notification: RendezvousNotification) -> None:
+        notification.second_arrived.set()
+        await notification.first_arrived.wait()
+
+
 class OtherNotificationHandler(NotificationHandler[Notification]):
     async def handle(self, notification: Notification) -> None:
         if isinstance(notification, MyNotification):
@@ -61,6 +120,17 @@ async def test_when_there_is_no_registered_request_handler_then_an_error_is_thro
         await mediator.send(request)
 
     assert_that(excinfo.value.request).is_equal_to(request)
+    assert_that(str(excinfo.value)).contains(MyRequest.__name__)
+
+
+def test_when_a_no_request_handler_found_error_is_pickled_then_keeps_its_request() -> None:
+    error = NoRequestHandlerFoundError(MyRequest("test"))
+
+    unpickled = pickle.loads(pickle.dumps(error))
+
+    assert_that(repr(error)).contains(MyRequest.__name__)
+    assert_that(unpickled.request.q).is_equal_to("test")
+    assert_that(str(unpickled)).is_equal_to(str(error))
 
 
 async def test_when_a_request_is_sent_then_is_managed_by_a_request_handler() -> None:
@@ -108,6 +178,58 @@ async def test_when_a_request_is_sent_with_multiple_pipeline_behaviors_then_beha
     assert_that(response.data["test"]).is_equal_to("test")
 
 
+async def test_when_a_pipeline_behavior_for_a_supertype_is_registered_first_then_is_executed_first() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(MyRequestHandler)
+    mediator.register_pipeline_behavior(OtherPipelineBehavior)
+    mediator.register_pipeline_behavior(MyPipelineBehavior)
+
+    response = await mediator.send(MyRequest())
+
+    assert_that(list(response.data.keys())).is_equal_to(["test", "other_test"])
+
+
+async def test_when_a_pipeline_behavior_is_registered_twice_then_is_executed_in_both_positions() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(TracedRequestHandler)
+    mediator.register_pipeline_behavior(RequestTracingPipelineBehavior)
+    mediator.register_pipeline_behavior(MyRequestTracingPipelineBehavior)
+    mediator.register_pipeline_behavior(RequestTracingPipelineBehavior)
+    request = TracedRequest()
+
+    await mediator.send(request)
+
+    assert_that(request.trace).is_equal_to(["request", "my_request", "request", "handler"])
+
+
+async def test_when_pipeline_behaviors_for_several_supertypes_are_registered_twice_then_are_executed_in_registration_order() -> None:  # noqa: E501
+    mediator = create_mediator()
+    mediator.register_request_handler(TracedRequestHandler)
+    for _ in range(2):
+        mediator.register_pipeline_behavior(RequestTracingPipelineBehavior)
+        mediator.register_pipeline_behavior(TracedRequestTracingPipelineBehavior)
+        mediator.register_pipeline_behavior(MyRequestTracingPipelineBehavior)
+    request = TracedRequest()
+
+    await mediator.send(request)
+
+    assert_that(request.trace).is_equal_to(
+        ["request", "traced_request", "my_request", "request", "traced_request", "my_request", "handler"]
+    )
+
+
+async def test_when_a_pipeline_behavior_does_not_call_next_behavior_then_the_rest_of_the_pipeline_is_not_executed() -> None:  # noqa: E501
+    mediator = create_mediator()
+    mediator.register_request_handler(MyRequestHandler)
+    mediator.register_pipeline_behavior(ShortCircuitPipelineBehavior)
+    mediator.register_pipeline_behavior(MyPipelineBehavior)
+
+    response = await mediator.send(MyRequest())
+
+    assert_that(response.result).is_equal_to("short_circuit")
+    assert_that(response.data).is_empty()
+
+
 async def test_when_there_are_no_any_registered_notification_handlers_then_an_error_is_thrown() -> None:
     mediator = create_mediator(raise_error_if_not_any_registered_notification_handler=True)
     notification = MyNotification()
@@ -115,6 +237,16 @@ async def test_when_there_are_no_any_registered_notification_handlers_then_an_er
         await mediator.publish(notification)
 
     assert_that(excinfo.value.notification).is_equal_to(notification)
+    assert_that(str(excinfo.value)).contains(MyNotification.__name__)
+
+
+def test_when_a_not_any_notification_handler_found_error_is_pickled_then_keeps_its_notification() -> None:
+    error = NotAnyNotificationHandlerFoundError(MyNotification())
+
+    unpickled = pickle.loads(pickle.dumps(error))
+
+    assert_that(repr(error)).contains(MyNotification.__name__)
+    assert_that(unpickled.notification).is_instance_of(MyNotification)
 
 
 async def test_when_there_are_no_any_registered_notification_handlers_and_raise_error_is_not_configured_then_no_error_is_thrown() -> None:  # noqa: E501
@@ -135,6 +267,50 @@ async def test_when_a_notification_is_sent_then_notification_handlers_are_execut
     assert_that(notification.data["other_test"]).is_equal_to("other_test")
 
 
+async def test_when_publish_strategy_is_parallel_then_notification_handlers_are_executed_concurrently() -> None:
+    mediator = create_mediator(publish_strategy="parallel")
+    mediator.register_notification_handler(FirstRendezvousNotificationHandler)
+    mediator.register_notification_handler(SecondRendezvousNotificationHandler)
+    notification = RendezvousNotification()
+
+    await asyncio.wait_for(mediator.publish(notification), timeout=1)
+
+    assert_that(notification.first_arrived.is_set()).is_true()
+    assert_that(notification.second_arrived.is_set()).is_true()
+
+
+async def test_when_publish_strategy_is_parallel_then_notification_handlers_for_supertypes_are_executed() -> None:
+    mediator = create_mediator(publish_strategy="parallel")
+    mediator.register_notification_handler(MyNotificationHandler)
+    mediator.register_notification_handler(OtherNotificationHandler)
+    notification = MyNotification()
+
+    await mediator.publish(notification)
+
+    assert_that(notification.data.keys()).is_length(2)
+
+
+async def test_when_publish_strategy_is_parallel_and_a_notification_handler_fails_then_the_rest_finish_before_the_error_is_thrown() -> None:  # noqa: E501
+    class _FailingNotificationHandler(NotificationHandler[MyNotification]):
+        async def handle(self, notification: MyNotification) -> None:
+            raise ValueError("test")
+
+    class _SlowNotificationHandler(NotificationHandler[MyNotification]):
+        async def handle(self, notification: MyNotification) -> None:
+            await asyncio.sleep(0.01)
+            notification.add_data("test", "test")
+
+    mediator = create_mediator(publish_strategy="parallel")
+    mediator.register_notification_handler(_FailingNotificationHandler)
+    mediator.register_notification_handler(_SlowNotificationHandler)
+    notification = MyNotification()
+
+    with pytest.raises(ValueError, match="test"):
+        await mediator.publish(notification)
+
+    assert_that(notification.data).contains_key("test")
+
+
 async def test_when_a_custom_request_handler_factory_is_supplied_then_is_used() -> None:
     async def _custom_request_handler_factory(request_handler: Type[RequestHandler]) -> RequestHandler:
         return MyRequestHandler()
@@ -170,3 +346,159 @@ async def test_when_a_custom_notification_handler_factory_is_supplied_then_is_us
     await mediator.publish(notification)
 
     mock_custom_notification_handler_factory.assert_called_once_with(MyNotificationHandler)
+
+
+async def test_when_a_pipeline_behavior_is_registered_after_a_request_is_sent_then_is_executed_in_next_sends() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(MyRequestHandler)
+    await mediator.send(MyRequest())
+    mediator.register_pipeline_behavior(MyPipelineBehavior)
+
+    response = await mediator.send(MyRequest())
+
+    assert_that(response.data).is_length(1)
+    assert_that(response.data["test"]).is_equal_to("test")
+
+
+async def test_when_a_notification_handler_is_registered_after_a_notification_is_published_then_is_executed_in_next_publishes() -> None:  # noqa: E501
+    mediator = create_mediator()
+    mediator.register_notification_handler(MyNotificationHandler)
+    await mediator.publish(MyNotification())
+    mediator.register_notification_handler(OtherNotificationHandler)
+    notification = MyNotification()
+
+    await mediator.publish(notification)
+
+    assert_that(notification.data.keys()).is_length(2)
+
+
+async def test_when_a_request_handler_is_registered_as_singleton_then_is_created_only_once() -> None:
+    mock_custom_request_handler_factory = AsyncMock(return_value=MyRequestHandler())
+    mediator = create_mediator(request_handler_factory=mock_custom_request_handler_factory)
+    mediator.register_request_handler(MyRequestHandler, singleton=True)
+
+    await mediator.send(MyRequest())
+    await mediator.send(MyRequest())
+
+    mock_custom_request_handler_factory.assert_called_once_with(MyRequestHandler)
+
+
+async def test_when_a_request_handler_is_not_registered_as_singleton_then_is_created_for_every_request() -> None:
+    mock_custom_request_handler_factory = AsyncMock(return_value=MyRequestHandler())
+    mediator = create_mediator(request_handler_factory=mock_custom_request_handler_factory)
+    mediator.register_request_handler(MyRequestHandler)
+
+    await mediator.send(MyRequest())
+    await mediator.send(MyRequest())
+
+    assert_that(mock_custom_request_handler_factory.call_count).is_equal_to(2)
+
+
+async def test_when_a_pipeline_behavior_is_registered_as_singleton_then_is_created_only_once() -> None:
+    mock_custom_pipeline_behavior_factory = AsyncMock(return_value=MyPipelineBehavior())
+    mediator = create_mediator(pipeline_behavior_factory=mock_custom_pipeline_behavior_factory)
+    mediator.register_request_handler(MyRequestHandler)
+    mediator.register_pipeline_behavior(MyPipelineBehavior, singleton=True)
+
+    await mediator.send(MyRequest())
+    await mediator.send(MyRequest())
+
+    mock_custom_pipeline_behavior_factory.assert_called_once_with(MyPipelineBehavior)
+
+
+async def test_when_a_notification_handler_is_registered_as_singleton_then_is_created_only_once() -> None:
+    mock_custom_notification_handler_factory = AsyncMock(return_value=MyNotificationHandler())
+    mediator = create_mediator(notification_handler_factory=mock_custom_notification_handler_factory)
+    mediator.register_notification_handler(MyNotificationHandler, singleton=True)
+
+    await mediator.publish(MyNotification())
+    await mediator.publish(MyNotification())
+
+    mock_custom_notification_handler_factory.assert_called_once_with(MyNotificationHandler)
+
+
+async def test_when_a_request_handler_and_its_pipeline_behaviors_are_singletons_then_are_created_only_once() -> None:
+    mock_custom_request_handler_factory = AsyncMock(return_value=MyRequestHandler())
+    mock_custom_pipeline_behavior_factory = AsyncMock(return_value=MyPipelineBehavior())
+    mediator = create_mediator(
+        request_handler_factory=mock_custom_request_handler_factory,
+        pipeline_behavior_factory=mock_custom_pipeline_behavior_factory,
+    )
+    mediator.register_request_handler(MyRequestHandler, singleton=True)
+    mediator.register_pipeline_behavior(MyPipelineBehavior, singleton=True)
+
+    await mediator.send(MyRequest())
+    response = await mediator.send(MyRequest())
+
+    assert_that(response.data["test"]).is_equal_to("test")
+    mock_custom_request_handler_factory.assert_called_once_with(MyRequestHandler)
+    mock_custom_pipeline_behavior_factory.assert_called_once_with(MyPipelineBehavior)
+
+
+async def test_when_a_request_is_sent_then_the_mediator_does_not_keep_a_reference_to_it() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(MyRequestHandler)
+    mediator.register_pipeline_behavior(MyPipelineBehavior)
+    request = MyRequest()
+    request_reference = weakref.ref(request)
+
+    await mediator.send(request)
+    del request
+    gc.collect()
+
+    assert_that(request_reference()).is_none()
+
+
+async def test_when_several_requests_are_sent_at_once_then_responses_are_returned_in_the_same_order() -> None:
+    class EchoRequestHandler(RequestHandler[MyRequest, MyResponse]):
+        async def handle(self, request: MyRequest) -> MyResponse:
+            return MyResponse(request.q)
+
+    mediator = create_mediator()
+    mediator.register_request_handler(EchoRequestHandler)
+
+    responses = await mediator.send_many([MyRequest("foo"), MyRequest("bar")])
+
+    assert_that([response.result for response in responses]).is_equal_to(["foo", "bar"])
+
+
+async def test_when_several_requests_of_different_types_are_sent_at_once_then_an_error_is_thrown() -> None:
+    class OtherRequest(MyRequest):
+        pass
+
+    mediator = create_mediator()
+    mediator.register_request_handler(MyRequestHandler)
+
+    with pytest.raises(ValueError):
+        await mediator.send_many([MyRequest(), OtherRequest()])
+
+
+async def test_when_a_singleton_is_first_used_concurrently_then_is_created_only_once() -> None:
+    created: list[RequestHandler] = []
+
+    async def _request_handler_factory(request_handler: Type[RequestHandler]) -> RequestHandler:
+        await asyncio.sleep(0)
+        instance = request_handler()
+        created.append(instance)
+        return instance
+
+    mediator = create_mediator(request_handler_factory=_request_handler_factory)
+    mediator.register_request_handler(MyRequestHandler, singleton=True)
+    mediator.register_pipeline_behavior(MyPipelineBehavior)
+
+    await asyncio.gather(*(mediator.send(MyRequest()) for _ in range(10)))
+    await mediator.send(MyRequest())
+
+    assert_that(created).is_length(1)
+
+
+async def test_when_the_creation_of_a_singleton_fails_then_is_retried_on_next_use() -> None:
+    mock_custom_request_handler_factory = AsyncMock(side_effect=[RuntimeError(), MyRequestHandler()])
+    mediator = create_mediator(request_handler_factory=mock_custom_request_handler_factory)
+    mediator.register_request_handler(MyRequestHandler, singleton=True)
+
+    with pytest.raises(RuntimeError):
+        await mediator.send(MyRequest())
+    response = await mediator.send(MyRequest())
+
+    assert_that(response.result).is_equal_to("test")
@@ -1,3 +1,4 @@
+import pytest
 from assertpy import assert_that
 
 from mediatpy import RequestHandler
@@ -10,6 +11,10 @@ class RequestHandlerWithNoUserDefinedClassAsResponse(RequestHandler[MyRequest, l
         return ["foo", "bar"]
 
 
+class RequestHandlerWithNoHandleMethod(RequestHandler[MyRequest, None]):
+    pass
+
+
 class RequestHandlerWithNoResponse(RequestHandler[MyRequest, None]):
     async def handle(self, request: MyRequest) -> None:
         ...
@@ -31,3 +36,11 @@ async def test_when_a_request_with_no_response_is_sent_then_is_managed_by_a_requ
     response = await mediator.send(MyRequest())
 
     assert_that(response).is_none()
+
+
+async def test_when_a_request_handler_does_not_override_handle_then_an_error_is_thrown() -> None:
+    mediator = create_mediator()
+    mediator.register_request_handler(RequestHandlerWithNoHandleMethod)
+
+    with pytest.raises(NotImplementedError):
+        await mediator.send(MyRequest())